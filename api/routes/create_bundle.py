@@ -63,7 +63,8 @@ async def create_bundle(request: BundleManifestDraft):
         merkle_root = computed_merkle_root
 
         # Create summary + manifest
-        created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        # Fixed-width microseconds keep created_at lexicographically sortable
+        created_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         summary = {
             "id": bundle_id,
             "created_at": created_at,
@@ -1,41 +1,67 @@
 """List bundles API endpoint."""
 
+import heapq
 import json
+from operator import attrgetter
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
 
-from shared.api_contracts.list_bundles import BundleListResponse
+from shared.api_contracts.list_bundles import (
+    BundleListResponse,
+    decode_cursor,
+    encode_cursor,
+)
 from shared.config import get_bundle_manifests_dir, get_bundle_summaries_dir
 from shared.logs import get_logger
 from shared.merkle import compute_merkle_root
-from shared.types import Blob, BundleSummary
+from shared.types import BLOB_LIST_ADAPTER, BundleSummary
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
 
-@router.get("/bundles")
-async def list_bundles():
+@router.get("/bundles", response_model=BundleListResponse)
+async def list_bundles(
+    limit: int | None = Query(default=None, ge=1, description="Page size"),
+    cursor: str | None = Query(default=None, description="Keyset cursor"),
+):
     """
-    List all available bundles with metadata.
+    List available bundles with metadata, one keyset page at a time.
 
-    Returns bundle summaries sorted by created_at descending (newest first).
-    Reads from summaries directory (which does NOT include files list).
+    Returns bundle summaries sorted by created_at descending (newest first),
+    with id as a tiebreaker. Reads from summaries directory (which does NOT
+    include files list).
+
+    Args:
+        limit: Maximum number of bundles to return (all remaining if omitted)
+        cursor: next_cursor from a previous page; resumes strictly after it
 
     Returns:
-        BundleListResponse with array of BundleSummary objects
+        BundleListResponse with array of BundleSummary objects and the
+        cursor for the next page (None on the last page)
 
     Raises:
         HTTPException:
+            - 422: Malformed cursor
             - 500: Storage read failure
     """
+    # Validate cursor
+    after: tuple[str, str] | None = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
     try:
         summaries_dir = get_bundle_summaries_dir()
 
         # Check if summaries directory exists
         if not summaries_dir.exists():
-            return BundleListResponse(bundles=[])
+            response = BundleListResponse(bundles=[])
+            return JSONResponse(status_code=200, content=response.model_dump())
 
         # Enumerate all .json files in summaries directory
         bundles = []
@@ -44,6 +70,11 @@ async def list_bundles():
                 # Read summary file
                 summary = json.loads(summary_path.read_text())
 
+                # Seek past the cursor before any manifest read or validation
+                position = (summary["created_at"], summary["id"])
+                if after is not None and position >= after:
+                    continue
+
                 # Backfill merkle root
                 merkle_root = summary.get("merkle_root")
                 if not merkle_root:
@@ -53,10 +84,9 @@ async def list_bundles():
                         manifest = json.loads(manifest_path.read_text())
                         merkle_root = manifest.get("merkle_root")
                         if not merkle_root:
-                            files = [
-                                Blob(**file_dict)
-                                for file_dict in manifest.get("files", [])
-                            ]
+                            files = BLOB_LIST_ADAPTER.validate_python(
+                                manifest.get("files", [])
+                            )
                             merkle_root = compute_merkle_root(files)
                     except Exception as manifest_error:
                         logger.warning(
@@ -80,10 +110,23 @@ async def list_bundles():
                 logger.warning(f"Skipping invalid summary {summary_path}: {e}")
                 continue
 
-        # Sort by created_at descending (newest first)
-        bundles.sort(key=lambda b: b.created_at, reverse=True)
-
-        return BundleListResponse(bundles=bundles)
+        # Order by (created_at, id) descending (newest first); a page only
+        # needs the top limit + 1 to know whether another page follows
+        sort_key = attrgetter("created_at", "id")
+        if limit is None:
+            bundles.sort(key=sort_key, reverse=True)
+        else:
+            bundles = heapq.nlargest(limit + 1, bundles, key=sort_key)
+
+        next_cursor = None
+        if limit is not None and len(bundles) > limit:
+            bundles = bundles[:limit]
+            next_cursor = encode_cursor(bundles[-1].created_at, bundles[-1].id)
+
+        # Dump the already-validated models directly instead of letting
+        # FastAPI walk them with jsonable_encoder
+        response = BundleListResponse(bundles=bundles, next_cursor=next_cursor)
+        return JSONResponse(status_code=200, content=response.model_dump())
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Storage error: {str(e)}") from e
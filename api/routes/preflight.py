@@ -1,6 +1,7 @@
 """Preflight API endpoint."""
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 
 from api.storage import blob_exists
 from shared.api_contracts.preflight import PreflightRequest, PreflightResponse
@@ -9,7 +10,7 @@ router = APIRouter()
 
 
 @router.post("/bundles/preflight", response_model=PreflightResponse)
-async def preflight(request: PreflightRequest) -> PreflightResponse:
+async def preflight(request: PreflightRequest):
     """
     Check which blobs need to be uploaded.
 
@@ -31,7 +32,8 @@ async def preflight(request: PreflightRequest) -> PreflightResponse:
             blob.hash for blob in request.files if not blob_exists(blob.hash)
         ]
 
-        return PreflightResponse(missing=missing_hashes)
+        # Serialize directly; response_model only documents the schema
+        return JSONResponse(status_code=200, content={"missing": missing_hashes})
 
     except Exception as e:
         raise HTTPException(
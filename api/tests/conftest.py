@@ -0,0 +1,28 @@
+"""Pytest configuration for API tests."""
+
+import pytest
+import requests
+from api.tests.helpers import BASE_URL, skip_unless_api
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "offline: test does not need a running API server"
+    )
+
+
+@pytest.fixture(scope="session")
+def api_available() -> bool:
+    """Probe the API server once per session."""
+    try:
+        requests.get(f"{BASE_URL}/status", timeout=0.5)
+    except requests.exceptions.RequestException:
+        return False
+    return True
+
+
+@pytest.fixture(autouse=True)
+def _skip_if_no_api(request, api_available):
+    """Skip server-backed tests instead of failing when the API is not running."""
+    if request.node.get_closest_marker("offline") is None:
+        skip_unless_api(api_available)
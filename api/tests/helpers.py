@@ -1,16 +1,24 @@
 """Shared test helpers and utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pytest
 import requests
-from pathlib import Path
 from api.storage import calculate_sha256
+from shared.config import get_bundle_summaries_dir
 from shared.merkle import compute_merkle_root
 from shared.types import Blob
-from shared.config import get_data_dir
 
 
 BASE_URL = "http://localhost:8000"
 
 
+def skip_unless_api(api_available: bool) -> None:
+    """Skip the current test or fixture when the API server is not running."""
+    if not api_available:
+        pytest.skip(f"API server not reachable at {BASE_URL}")
+
+
 def create_blob(content: bytes) -> str:
     """
     Helper: Create a blob and return its hash.
@@ -49,10 +57,14 @@ def create_bundle(files_data: list[tuple[bytes, str]]) -> dict:
     Raises:
         AssertionError: If the bundle creation fails
     """
+    # Upload blobs concurrently; map() preserves the input order
+    contents = [content for content, _ in files_data]
+    with ThreadPoolExecutor(max_workers=min(8, len(contents)) or 1) as executor:
+        hashes = list(executor.map(create_blob, contents))
+
     files_payload = []
     blobs = []
-    for content, path in files_data:
-        hash_val = create_blob(content)
+    for (content, path), hash_val in zip(files_data, hashes):
         blob_data = {
             "bundle_path": path,
             "size_bytes": len(content),
@@ -76,3 +88,20 @@ def create_bundle(files_data: list[tuple[bytes, str]]) -> dict:
         f"Failed to create bundle: {response.status_code}"
     )
     return response.json()
+
+
+def clear_bundle_summaries() -> None:
+    """
+    Helper: Remove all bundle summaries so the server lists no bundles.
+
+    Unlinks the summary files in place via os.scandir, leaving the
+    directory itself (and the manifests and blobs) untouched.
+    """
+    try:
+        with os.scandir(get_bundle_summaries_dir()) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        # No summaries directory yet, so there is nothing to clear
+        pass
@@ -1,5 +1,6 @@
+import time
+import pytest
 import requests
-from pathlib import Path
 from api.storage import calculate_sha256
 from api.tests.helpers import BASE_URL
 from shared.config import get_blobs_dir
@@ -7,8 +8,6 @@ from shared.config import get_blobs_dir
 
 def test_create_blob_new():
     """Test creating a new blob."""
-    import time
-
     content = f"test content for new blob {time.time()}".encode()
     hash_val = calculate_sha256(content)
 
@@ -33,8 +32,6 @@ def test_create_blob_new():
 
 def test_create_blob_idempotent():
     """Test that uploading same blob twice is idempotent."""
-    import time
-
     content = f"idempotent test content {time.time()}".encode()
     hash_val = calculate_sha256(content)
 
@@ -79,23 +76,17 @@ def test_create_blob_hash_mismatch():
     assert not blob_path.exists()
 
 
-def test_create_blob_invalid_hash_length():
-    """Test that invalid hash length returns 400."""
-    content = b"test content"
-    invalid_hash = "abc123"  # Too short
-
-    response = requests.put(
-        f"{BASE_URL}/blobs/{invalid_hash}",
-        params={"size_bytes": len(content)},
-        data=content,
-    )
-    assert response.status_code == 422  # FastAPI validation error
-
-
-def test_create_blob_invalid_hash_chars():
-    """Test that invalid hash characters returns 400."""
+@pytest.mark.parametrize(
+    "invalid_hash",
+    [
+        pytest.param("abc123", id="too-short"),
+        pytest.param("Z" * 64, id="invalid-chars"),
+        pytest.param(calculate_sha256(b"test content").upper(), id="uppercase"),
+    ],
+)
+def test_create_blob_invalid_hash(invalid_hash):
+    """Test that malformed hashes are rejected with 422."""
     content = b"test content"
-    invalid_hash = "Z" * 64  # Invalid characters
 
     response = requests.put(
         f"{BASE_URL}/blobs/{invalid_hash}",
@@ -105,19 +96,6 @@ def test_create_blob_invalid_hash_chars():
     assert response.status_code == 422
 
 
-def test_create_blob_uppercase_hash():
-    """Test that uppercase hash is rejected."""
-    content = b"test content"
-    hash_val = calculate_sha256(content).upper()  # Uppercase
-
-    response = requests.put(
-        f"{BASE_URL}/blobs/{hash_val}",
-        params={"size_bytes": len(content)},
-        data=content,
-    )
-    assert response.status_code == 422
-
-
 def test_create_blob_negative_size():
     """Test that negative size returns 422."""
     content = b"test content"
@@ -1,4 +1,5 @@
 import hashlib
+import pytest
 import requests
 import json
 from pathlib import Path
@@ -10,8 +11,6 @@ from shared.types import Blob
 def test_create_bundle_simple():
     """Test creating a simple bundle with one file."""
     # Use real fixture file content
-    from pathlib import Path
-
     fixture_file = Path("tests/fixtures/test_data/single_file.txt")
     with open(fixture_file, "rb") as f:
         content = f.read()
@@ -22,7 +21,6 @@ def test_create_bundle_simple():
         bundle_path="single_file.txt",
         size_bytes=len(content),
         hash=hash_val,
-        hash_algo="sha256",
     )
     merkle_root = compute_merkle_root([blob])
 
@@ -61,7 +59,6 @@ def test_create_bundle_simple():
                 bundle_path="single_file.txt",
                 size_bytes=len(content),
                 hash=hash_val,
-                hash_algo="sha256",
             )
         ]
     )
@@ -114,7 +111,6 @@ def test_create_bundle_multiple_files():
                 bundle_path=path,
                 size_bytes=len(content),
                 hash=hash_val,
-                hash_algo="sha256",
             )
         )
         total_bytes += len(content)
@@ -157,9 +153,7 @@ def test_create_bundle_missing_blob():
     fake_hash = "a" * 64
 
     # Create blob object for merkle root computation (even though blob doesn't exist)
-    blob = Blob(
-        bundle_path="file.txt", size_bytes=100, hash=fake_hash, hash_algo="sha256"
-    )
+    blob = Blob(bundle_path="file.txt", size_bytes=100, hash=fake_hash)
     merkle_root = compute_merkle_root([blob])
 
     response = requests.post(
@@ -352,7 +346,6 @@ def test_create_bundle_statistics():
                 bundle_path=path,
                 size_bytes=len(content),
                 hash=hash_val,
-                hash_algo="sha256",
             )
         )
 
@@ -388,13 +381,14 @@ def test_create_bundle_statistics():
     assert summary["merkle_root"] == expected_root
 
 
+@pytest.mark.offline
 def test_compute_merkle_root_manual_calculation():
     """Manually compute the Merkle root to validate the helper implementation."""
 
     blobs = [
-        Blob(bundle_path="a.txt", size_bytes=1, hash="a" * 64, hash_algo="sha256"),
-        Blob(bundle_path="b.txt", size_bytes=1, hash="b" * 64, hash_algo="sha256"),
-        Blob(bundle_path="c.txt", size_bytes=1, hash="c" * 64, hash_algo="sha256"),
+        Blob(bundle_path="a.txt", size_bytes=1, hash="a" * 64),
+        Blob(bundle_path="b.txt", size_bytes=1, hash="b" * 64),
+        Blob(bundle_path="c.txt", size_bytes=1, hash="c" * 64),
     ]
 
     result = compute_merkle_root(blobs)
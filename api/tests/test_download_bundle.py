@@ -1,8 +1,7 @@
 import requests
 import zipfile
 import io
-from pathlib import Path
-from api.tests.helpers import BASE_URL, create_blob, create_bundle
+from api.tests.helpers import BASE_URL, create_bundle
 
 
 def test_download_bundle_simple():
@@ -1,16 +1,18 @@
+import pytest
 import requests
-from pathlib import Path
-from api.tests.helpers import BASE_URL, create_blob, create_bundle
-from shared.config import get_data_dir
+from api.tests.helpers import (
+    BASE_URL,
+    clear_bundle_summaries,
+    create_bundle,
+    skip_unless_api,
+)
+from cli.client import BundlesAPIClient
+from shared.api_contracts.list_bundles import encode_cursor
 
 
 def test_list_bundles_empty():
     """Test listing bundles when none exist."""
-    # Clean up bundles summaries directory
-    summaries_dir = get_data_dir() / "bundles" / "summaries"
-    if summaries_dir.exists():
-        for bundle_file in summaries_dir.glob("*.json"):
-            bundle_file.unlink()
+    clear_bundle_summaries()
 
     response = requests.get(f"{BASE_URL}/bundles")
     assert response.status_code == 200
@@ -85,14 +87,13 @@ def test_list_bundles_multiple():
 
 def test_list_bundles_sorted_by_created_at():
     """Test that bundles are sorted by created_at descending (newest first)."""
-    import time
-
-    # Create bundles with small delays to ensure different timestamps
+    # Sequential requests are timestamped by the server with microsecond
+    # resolution, so no sleeps are needed to get distinct created_at values
     bundle1 = create_bundle([(b"first", "1.txt")])
-    time.sleep(0.1)
     bundle2 = create_bundle([(b"second", "2.txt")])
-    time.sleep(0.1)
     bundle3 = create_bundle([(b"third", "3.txt")])
+    created = [bundle1, bundle2, bundle3]
+    assert len({b["created_at"] for b in created}) == 3
 
     response = requests.get(f"{BASE_URL}/bundles")
     assert response.status_code == 200
@@ -100,21 +101,19 @@ def test_list_bundles_sorted_by_created_at():
 
     bundles = data["bundles"]
 
-    # Find our test bundles by looking for bundles with 1 file and 5 bytes
-    # (each of our test bundles has this characteristic)
-    test_bundles = [
-        b for b in bundles if b["file_count"] == 1 and b["total_bytes"] == 5
-    ]
-    assert len(test_bundles) >= 3  # We created 3 bundles, but there might be others
-
-    # Verify all test bundles have valid merkle roots
-    for entry in test_bundles:
+    # Verify all bundles have valid merkle roots
+    for entry in bundles:
         assert len(entry["merkle_root"]) == 64
 
     # Verify sorting (newest first) - check that created_at timestamps are in descending order
-    created_at_times = [b["created_at"] for b in test_bundles]
+    created_at_times = [b["created_at"] for b in bundles]
     assert created_at_times == sorted(created_at_times, reverse=True)
 
+    # Our bundles appear newest first
+    created_ids = {b["id"] for b in created}
+    listed_ids = [b["id"] for b in bundles if b["id"] in created_ids]
+    assert listed_ids == [bundle3["id"], bundle2["id"], bundle1["id"]]
+
 
 def test_list_bundles_response_schema():
     """Test that response matches BundleListResponse schema."""
@@ -208,3 +207,106 @@ def test_list_bundles_empty_bundle():
     assert bundle["file_count"] == 0
     assert bundle["total_bytes"] == 0
     assert len(bundle["merkle_root"]) == 64
+
+
+@pytest.fixture(scope="module")
+def paginated_bundles(api_available):
+    """Create three bundles once for all pagination tests in this module."""
+    skip_unless_api(api_available)
+    return [create_bundle([(f"page {i}".encode(), f"page{i}.txt")]) for i in range(3)]
+
+
+def test_list_bundles_without_limit_has_no_next_cursor(paginated_bundles):
+    """Test that an unpaginated listing returns every bundle on one page."""
+    response = requests.get(f"{BASE_URL}/bundles")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["next_cursor"] is None
+
+    listed_ids = {b["id"] for b in data["bundles"]}
+    assert {b["id"] for b in paginated_bundles} <= listed_ids
+
+
+def test_list_bundles_pagination_walks_all_pages(paginated_bundles):
+    """Test that following next_cursor visits every bundle exactly once, in order."""
+    response = requests.get(f"{BASE_URL}/bundles")
+    assert response.status_code == 200
+    expected_ids = [b["id"] for b in response.json()["bundles"]]
+    assert len(expected_ids) >= len(paginated_bundles)
+
+    paged_ids = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = requests.get(f"{BASE_URL}/bundles", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["bundles"]) <= 2
+        paged_ids.extend(b["id"] for b in data["bundles"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert paged_ids == expected_ids
+
+
+@pytest.mark.parametrize("index", range(3))
+def test_list_bundles_page_matches_full_listing(paginated_bundles, index):
+    """Test that a single-bundle page resumed from a cursor matches the full listing."""
+    response = requests.get(f"{BASE_URL}/bundles")
+    full = response.json()["bundles"]
+
+    params = {"limit": 1}
+    if index > 0:
+        previous = full[index - 1]
+        params["cursor"] = encode_cursor(previous["created_at"], previous["id"])
+    response = requests.get(f"{BASE_URL}/bundles", params=params)
+    assert response.status_code == 200
+    assert response.json()["bundles"] == [full[index]]
+
+
+def test_list_bundles_last_page_has_no_next_cursor(paginated_bundles):
+    """Test that the page holding the final bundle does not return a cursor."""
+    response = requests.get(f"{BASE_URL}/bundles")
+    total = len(response.json()["bundles"])
+
+    response = requests.get(f"{BASE_URL}/bundles", params={"limit": total})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["bundles"]) == total
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.parametrize("single_page", [False, True])
+def test_iter_bundles_matches_full_listing(paginated_bundles, single_page):
+    """Test that the client pager yields the unpaged order without extra requests."""
+    response = requests.get(f"{BASE_URL}/bundles")
+    full_ids = [b["id"] for b in response.json()["bundles"]]
+    page_size = len(full_ids) if single_page else 1
+
+    client = BundlesAPIClient(BASE_URL)
+    list_bundles = client.list_bundles
+    calls = []
+
+    def counting_list_bundles(**kwargs):
+        calls.append(kwargs)
+        return list_bundles(**kwargs)
+
+    client.list_bundles = counting_list_bundles
+    paged_ids = [b.id for b in client.iter_bundles(page_size=page_size)]
+    assert paged_ids == full_ids
+    assert len(calls) == len(full_ids) // page_size
+
+
+def test_list_bundles_invalid_limit():
+    """Test that a non-positive limit returns 422."""
+    response = requests.get(f"{BASE_URL}/bundles", params={"limit": 0})
+    assert response.status_code == 422
+
+
+def test_list_bundles_invalid_cursor():
+    """Test that a malformed cursor returns 422."""
+    response = requests.get(f"{BASE_URL}/bundles", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
@@ -1,5 +1,5 @@
+import pytest
 import requests
-from pathlib import Path
 from api.tests.helpers import BASE_URL
 from shared.config import get_data_dir
 
@@ -40,111 +40,27 @@ def test_preflight_all_missing():
     assert "b" * 64 in data["missing"]
 
 
-def test_preflight_invalid_hash_length():
-    """Test preflight with invalid hash length."""
-    response = requests.post(
-        f"{BASE_URL}/bundles/preflight",
-        json={
-            "files": [
-                {
-                    "bundle_path": "file1.txt",
-                    "size_bytes": 100,
-                    "hash": "abc123",  # Too short
-                    "hash_algo": "sha256",
-                }
-            ]
-        },
-    )
-    assert response.status_code == 422  # Validation error
-
-
-def test_preflight_invalid_hash_chars():
-    """Test preflight with invalid hash characters."""
-    response = requests.post(
-        f"{BASE_URL}/bundles/preflight",
-        json={
-            "files": [
-                {
-                    "bundle_path": "file1.txt",
-                    "size_bytes": 100,
-                    "hash": "Z" * 64,  # Invalid char
-                    "hash_algo": "sha256",
-                }
-            ]
-        },
-    )
-    assert response.status_code == 422
-
-
-def test_preflight_uppercase_hash():
-    """Test preflight rejects uppercase hash."""
-    response = requests.post(
-        f"{BASE_URL}/bundles/preflight",
-        json={
-            "files": [
-                {
-                    "bundle_path": "file1.txt",
-                    "size_bytes": 100,
-                    "hash": "A" * 64,  # Uppercase
-                    "hash_algo": "sha256",
-                }
-            ]
-        },
-    )
-    assert response.status_code == 422
-
-
-def test_preflight_negative_size():
-    """Test preflight with negative file size."""
-    response = requests.post(
-        f"{BASE_URL}/bundles/preflight",
-        json={
-            "files": [
-                {
-                    "bundle_path": "file1.txt",
-                    "size_bytes": -100,
-                    "hash": "a" * 64,
-                    "hash_algo": "sha256",
-                }
-            ]
-        },
-    )
-    assert response.status_code == 422
-
-
-def test_preflight_absolute_path():
-    """Test preflight with absolute path."""
-    response = requests.post(
-        f"{BASE_URL}/bundles/preflight",
-        json={
-            "files": [
-                {
-                    "bundle_path": "/absolute/path.txt",
-                    "size_bytes": 100,
-                    "hash": "a" * 64,
-                    "hash_algo": "sha256",
-                }
-            ]
-        },
-    )
-    assert response.status_code == 422
-
-
-def test_preflight_path_with_dotdot():
-    """Test preflight with path containing '..'."""
-    response = requests.post(
-        f"{BASE_URL}/bundles/preflight",
-        json={
-            "files": [
-                {
-                    "bundle_path": "../etc/passwd",
-                    "size_bytes": 100,
-                    "hash": "a" * 64,
-                    "hash_algo": "sha256",
-                }
-            ]
-        },
-    )
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        pytest.param({"hash": "abc123"}, id="hash-too-short"),
+        pytest.param({"hash": "Z" * 64}, id="hash-invalid-chars"),
+        pytest.param({"hash": "A" * 64}, id="hash-uppercase"),
+        pytest.param({"size_bytes": -100}, id="negative-size"),
+        pytest.param({"bundle_path": "/absolute/path.txt"}, id="absolute-path"),
+        pytest.param({"bundle_path": "../etc/passwd"}, id="path-with-dotdot"),
+    ],
+)
+def test_preflight_invalid_file(overrides):
+    """Test preflight rejects a file with an invalid hash, size, or path."""
+    file = {
+        "bundle_path": "file1.txt",
+        "size_bytes": 100,
+        "hash": "a" * 64,
+        "hash_algo": "sha256",
+        **overrides,
+    }
+    response = requests.post(f"{BASE_URL}/bundles/preflight", json={"files": [file]})
     assert response.status_code == 422
 
 
@@ -7,8 +7,9 @@ import requests
 
 from shared.api_contracts.create_bundle import BundleCreateResponse, BundleManifestDraft
 from shared.api_contracts.download_bundle import DownloadBundleParams
-from shared.api_contracts.list_bundles import BundleListResponse
+from shared.api_contracts.list_bundles import BundleListResponse, ListBundlesParams
 from shared.api_contracts.preflight import PreflightRequest, PreflightResponse
+from shared.types import BundleSummary
 
 
 class BundlesAPIClient:
@@ -41,7 +42,7 @@ class BundlesAPIClient:
             url, json=request.model_dump(), timeout=self.timeout
         )
         response.raise_for_status()
-        return PreflightResponse(**response.json())
+        return PreflightResponse.model_validate_json(response.content)
 
     def upload_blob(self, hash: str, size_bytes: int, file_obj: BinaryIO) -> bool:
         """
@@ -78,19 +79,51 @@ class BundlesAPIClient:
             url, json=manifest.model_dump(), timeout=self.timeout
         )
         response.raise_for_status()
-        return BundleCreateResponse(**response.json())
+        return BundleCreateResponse.model_validate_json(response.content)
 
-    def list_bundles(self) -> BundleListResponse:
+    def list_bundles(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> BundleListResponse:
         """
-        List all available bundles.
+        List available bundles, optionally one keyset page at a time.
+
+        Args:
+            limit: Maximum bundles to return (default: all)
+            cursor: next_cursor from a previous page to resume after
 
         Returns:
-            BundleListResponse with list of bundle summaries
+            BundleListResponse with list of bundle summaries and next_cursor
         """
         url = f"{self.base_url}/bundles"
-        response = self.session.get(url, timeout=self.timeout)
+        params = ListBundlesParams(limit=limit, cursor=cursor).model_dump(
+            exclude_none=True
+        )
+        response = self.session.get(url, params=params, timeout=self.timeout)
         response.raise_for_status()
-        return BundleListResponse(**response.json())
+        return BundleListResponse.model_validate_json(response.content)
+
+    def iter_bundles(self, page_size: int = 100) -> Iterator[BundleSummary]:
+        """
+        Iterate over all bundles, fetching one keyset page at a time.
+
+        The server only returns next_cursor when more bundles remain, so the
+        last page never costs an extra round trip. Each page still reads every
+        summary on the server, so walking all pages costs O(N^2/page_size)
+        reads; call list_bundles() without a limit to fetch the full list.
+
+        Args:
+            page_size: Number of bundles to request per page (default: 100)
+
+        Returns:
+            Iterator of bundle summaries, newest first
+        """
+        cursor = None
+        while True:
+            page = self.list_bundles(limit=page_size, cursor=cursor)
+            yield from page.bundles
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
 
     def download_bundle(
         self, bundle_id: str, format: Literal["zip"] = "zip"
@@ -73,5 +73,5 @@ def format_size(bytes_count: int) -> str:
 
 def format_timestamp(iso_timestamp: str) -> str:
     """Format ISO timestamp as readable string."""
-    # Simple format: "2023-12-25T10:30:00Z" -> "2023-12-25 10:30:00"
-    return iso_timestamp.replace("T", " ").replace("Z", "")
+    # Simple format: "2023-12-25T10:30:00.000000Z" -> "2023-12-25 10:30:00"
+    return iso_timestamp.replace("T", " ").replace("Z", "").partition(".")[0]
@@ -52,7 +52,6 @@ def create_bundle(
             bundle_path=file.relative_path,
             size_bytes=file.size_bytes,
             hash=file_hash,
-            hash_algo="sha256",
         )
         blobs.append(blob)
 
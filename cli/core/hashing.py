@@ -8,16 +8,21 @@ def hash_file_sha256(file_path: Path, chunk_size: int = 65536) -> str:
     """
     Calculate SHA-256 hash of a file using streaming to support large files.
 
+    On Python 3.11+ the file is fed to the hash by hashlib.file_digest, which
+    reads and updates in C without returning to the interpreter per chunk.
+
     Args:
         file_path: Path to the file to hash
-        chunk_size: Size of chunks to read (default 64KB)
+        chunk_size: Size of chunks to read (default 64KB; used on Python < 3.11)
 
     Returns:
         Lowercase hexadecimal SHA-256 hash (64 characters)
     """
-    sha256 = hashlib.sha256()
-
     with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        sha256 = hashlib.sha256()
         while chunk := f.read(chunk_size):
             sha256.update(chunk)
 
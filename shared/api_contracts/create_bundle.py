@@ -5,7 +5,7 @@ from typing import Literal
 from pydantic import BaseModel, Field, field_validator
 
 from shared.types import Blob
-from shared.validation import validate_sha256_hash
+from shared.validation import ensure_unique_paths, validate_sha256_hash
 
 
 class BundleManifestDraft(BaseModel):
@@ -26,10 +26,7 @@ class BundleManifestDraft(BaseModel):
     @classmethod
     def validate_no_duplicate_paths(cls, files: list[Blob]) -> list[Blob]:
         """Ensure no duplicate paths in the request."""
-        paths = [f.bundle_path for f in files]
-        if len(paths) != len(set(paths)):
-            raise ValueError("Duplicate paths found in request")
-        return files
+        return ensure_unique_paths(files)
 
 
 class BundleCreateResponse(BaseModel):
@@ -39,7 +36,7 @@ class BundleCreateResponse(BaseModel):
         ..., description="Unique bundle identifier (ULID if auto-generated)"
     )
     created_at: str = Field(
-        ..., description="ISO 8601 timestamp (e.g., '2023-12-25T10:30:00Z')"
+        ..., description="ISO 8601 timestamp (e.g., '2023-12-25T10:30:00.000000Z')"
     )
     merkle_root: str = Field(..., description="Merkle root over bundle files")
 
@@ -1,13 +1,72 @@
 """API contracts for list bundles endpoint."""
 
-from pydantic import BaseModel, Field
+import base64
+import binascii
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from shared.types import BundleSummary
 
 
+class ListBundlesParams(BaseModel):
+    """Query parameters for listing bundles."""
+
+    limit: int | None = Field(
+        default=None, ge=1, description="Maximum bundles per page (all if omitted)"
+    )
+    cursor: str | None = Field(
+        default=None, description="Opaque cursor taken from a previous next_cursor"
+    )
+
+
 class BundleListResponse(BaseModel):
     """Response schema for listing bundles."""
 
+    model_config = ConfigDict(frozen=True)
+
     bundles: list[BundleSummary] = Field(
         ..., description="Array of bundle summaries, sorted by created_at descending"
     )
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, or null on the last page"
+    )
+
+
+def encode_cursor(created_at: str, bundle_id: str) -> str:
+    """
+    Encode the keyset position of a bundle as an opaque cursor.
+
+    Args:
+        created_at: ISO 8601 timestamp of the last bundle on the page
+        bundle_id: ID of the last bundle on the page (ordering tiebreaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{created_at}|{bundle_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous BundleListResponse
+
+    Returns:
+        (created_at, bundle_id) keyset position
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, sep, bundle_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        )
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not sep or not created_at or not bundle_id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return created_at, bundle_id
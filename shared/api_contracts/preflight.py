@@ -3,6 +3,7 @@
 from pydantic import BaseModel, field_validator
 
 from shared.types import Blob
+from shared.validation import ensure_unique_paths
 
 
 class PreflightRequest(BaseModel):
@@ -14,10 +15,7 @@ class PreflightRequest(BaseModel):
     @classmethod
     def validate_no_duplicate_paths(cls, files: list[Blob]) -> list[Blob]:
         """Ensure no duplicate paths in the request."""
-        paths = [f.bundle_path for f in files]
-        if len(paths) != len(set(paths)):
-            raise ValueError("Duplicate paths found in request")
-        return files
+        return ensure_unique_paths(files)
 
 
 class PreflightResponse(BaseModel):
@@ -1,5 +1,6 @@
 """Shared configuration for API and CLI."""
 
+from functools import cache
 import os
 from pathlib import Path
 
@@ -8,31 +9,37 @@ from pathlib import Path
 # ============================================================================
 
 
+@cache
 def get_data_dir() -> Path:
-    """Get the data directory path (dynamically reads from env)."""
+    """Get the data directory path (reads DATA_DIR from env on first call)."""
     return Path(os.getenv("DATA_DIR", "api/.data"))
 
 
+@cache
 def get_blobs_dir() -> Path:
     """Get the blobs directory path."""
     return get_data_dir() / "blobs"
 
 
+@cache
 def get_bundles_dir() -> Path:
     """Get the bundles directory path."""
     return get_data_dir() / "bundles"
 
 
+@cache
 def get_bundle_manifests_dir() -> Path:
     """Get the bundle manifests directory path."""
     return get_bundles_dir() / "manifests"
 
 
+@cache
 def get_bundle_summaries_dir() -> Path:
     """Get the bundle summaries directory path."""
     return get_bundles_dir() / "summaries"
 
 
+@cache
 def get_tmp_dir() -> Path:
     """Get the temp directory path."""
     return get_data_dir() / "tmp"
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 import hashlib
+from operator import itemgetter
 from typing import Protocol, runtime_checkable
 
+_sha256 = hashlib.sha256
+
 
 @runtime_checkable
 class _BlobLike(Protocol):
@@ -33,22 +36,22 @@ def compute_merkle_root(blobs: Iterable[_BlobLike | dict]) -> str:
     string.
     """
 
-    leaf_digests: list[bytes] = []
-    for bundle_path, hash_str in sorted(
-        (_normalize_blob(blob) for blob in blobs), key=lambda item: item[0]
-    ):
-        leaf_input = f"{bundle_path}:{hash_str}".encode()
-        leaf_digests.append(hashlib.sha256(leaf_input).digest())
+    leaf_digests = [
+        _sha256(f"{bundle_path}:{hash_str}".encode()).digest()
+        for bundle_path, hash_str in sorted(
+            (_normalize_blob(blob) for blob in blobs), key=itemgetter(0)
+        )
+    ]
 
     if not leaf_digests:
-        return hashlib.sha256(b"").hexdigest()
+        return _sha256(b"").hexdigest()
 
     while len(leaf_digests) > 1:
         if len(leaf_digests) % 2 == 1:
             leaf_digests.append(leaf_digests[-1])
 
         leaf_digests = [
-            hashlib.sha256(leaf_digests[i] + leaf_digests[i + 1]).digest()
+            _sha256(leaf_digests[i] + leaf_digests[i + 1]).digest()
             for i in range(0, len(leaf_digests), 2)
         ]
 
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from shared.validation import validate_relative_path, validate_sha256_hash
 
@@ -8,6 +8,8 @@ from shared.validation import validate_relative_path, validate_sha256_hash
 class Blob(BaseModel):
     """Represents a file with its content hash and metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     bundle_path: str = Field(
         ..., description="Relative path within bundle. No '..' or leading '/'"
     )
@@ -18,7 +20,8 @@ class Blob(BaseModel):
         ..., description="Content hash (64-character lowercase hex for SHA-256)"
     )
     hash_algo: Literal["sha256"] = Field(
-        ..., description="Hash algorithm used (only sha256 supported)"
+        default="sha256",
+        description="Deprecated; the bundle-level hash_algo is authoritative",
     )
 
     @field_validator("hash")
@@ -32,12 +35,18 @@ class Blob(BaseModel):
         return validate_relative_path(v)
 
 
+# Validates a list of raw file dicts into Blobs in a single pydantic-core call
+BLOB_LIST_ADAPTER = TypeAdapter(list[Blob])
+
+
 class BundleSummary(BaseModel):
     """Core metadata for a bundle, excluding files list."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique bundle identifier")
     created_at: str = Field(
-        ..., description="ISO 8601 timestamp (e.g., '2023-12-25T10:30:00Z')"
+        ..., description="ISO 8601 timestamp (e.g., '2023-12-25T10:30:00.000000Z')"
     )
     hash_algo: Literal["sha256"] = Field(
         default="sha256", description="Hash algorithm used"
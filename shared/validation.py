@@ -1,5 +1,19 @@
 """Shared validation logic for paths and hashes."""
 
+import re
+from typing import Protocol, TypeVar
+
+
+class _HasBundlePath(Protocol):
+    """Protocol for the minimal fields required to check path uniqueness."""
+
+    bundle_path: str
+
+
+_FileT = TypeVar("_FileT", bound=_HasBundlePath)
+
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
 
 def validate_sha256_hash(hash_str: str) -> str:
     """
@@ -19,7 +33,7 @@ def validate_sha256_hash(hash_str: str) -> str:
             f"SHA-256 hash must be exactly 64 characters, got {len(hash_str)}"
         )
 
-    if not all(c in "0123456789abcdef" for c in hash_str):
+    if not _SHA256_HEX.fullmatch(hash_str):
         raise ValueError("Hash must be lowercase hexadecimal (0-9, a-f)")
 
     return hash_str
@@ -41,10 +55,32 @@ def validate_relative_path(path: str) -> str:
     if path.startswith("/"):
         raise ValueError("Path must be relative (no leading '/')")
 
-    if ".." in path.split("/"):
+    # Match '..' only as a whole segment, without allocating a segment list
+    if path == ".." or path.startswith("../") or path.endswith("/..") or "/../" in path:
         raise ValueError("Path cannot contain '..' (directory traversal)")
 
     if not path:
         raise ValueError("Path cannot be empty")
 
     return path
+
+
+def ensure_unique_paths(files: list[_FileT]) -> list[_FileT]:
+    """
+    Validate that no two files share a bundle path.
+
+    Args:
+        files: The files to check
+
+    Returns:
+        The validated files, unchanged
+
+    Raises:
+        ValueError: On the first duplicate bundle path
+    """
+    seen: set[str] = set()
+    for file in files:
+        if file.bundle_path in seen:
+            raise ValueError(f"Duplicate paths found in request: {file.bundle_path}")
+        seen.add(file.bundle_path)
+    return files